@@ -30,7 +30,7 @@ class SegmentDecl:
 class SegmentPlugin(hs.Plugin):
     def __init__(self, *segments: SegmentDecl):
         super().__init__()
-        self.interact_queue += segments
+        self.interact_queue.extend(segments)
 
     def _handle_interact(self, *objs: SegmentDecl):
         for seg in objs:
@@ -2,8 +2,9 @@ from ..emulator import HyperEmu
 from ..util import log
 
 from abc import abstractmethod, ABC
+from collections import deque
 
-from typing import List, Optional, Iterable, Type, TypeVar, TYPE_CHECKING
+from typing import Deque, List, Optional, Iterable, Type, TypeVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..settings import SettingsType
@@ -16,7 +17,7 @@ class Plugin:
     _PLUGIN_TYPE = TypeVar('_PLUGIN_TYPE', bound='Plugin')
 
     def __init__(self):
-        self.interact_queue = []
+        self.interact_queue: Deque = deque()
         self.emu: Optional[HyperEmu] = None
 
     @property
@@ -32,7 +33,7 @@ class Plugin:
         if self.ready:
             self._handle_interact(*objs)
         else:
-            self.interact_queue += objs
+            self.interact_queue.extend(objs)
 
     @abstractmethod
     def _handle_interact(self, *objs: '_INTERACT_TYPE'):